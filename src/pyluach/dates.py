@@ -17,14 +17,79 @@ only. No attributes should be changed once they're created.
 """
 
 import abc
+from bisect import bisect_right
 from datetime import date
-from numbers import Number
 from enum import Enum, auto
+from functools import lru_cache
+from math import floor
 
 from pyluach import utils
 from pyluach import gematria
 
 
+_GREGORIAN_MONTH_LENGTHS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@lru_cache(maxsize=4096)
+def _greg_from_jd(jd_int):
+    """Return the Gregorian ``(year, month, day)`` of a day number.
+
+    `jd_int` is the integer Julian day number (``jd + .5``).
+    """
+    # Days since March 1, year 0 of the proleptic Gregorian calendar.
+    n = jd_int - 1721120
+    century, n_c = divmod(4*n + 3, 146097)
+    p_2 = 2939745 * (4*(n_c >> 2) + 3)
+    year_of_century, remainder = divmod(p_2, 1 << 32)
+    day_of_year = remainder // 11758980
+    n_3 = 2141*day_of_year + 197913
+    month = n_3 >> 16
+    day = (n_3 & 0xFFFF) // 2141 + 1
+    year = 100*century + year_of_century
+    if day_of_year >= 306:  # January and February
+        year += 1
+        month -= 12
+    if year < 1:
+        year -= 1
+    return year, month, day
+
+
+@lru_cache(maxsize=4096)
+def _heb_from_jd(jd_int):
+    """Return the Hebrew ``(year, month, day)`` of a day number.
+
+    `jd_int` is the integer Julian day number (``jd + .5``) and must be
+    after creation.
+    """
+    jd = jd_int - 347997
+    # The mean Hebrew year is about 365.2468 days so the estimate
+    # is off by at most a year.
+    year = int(jd / 365.2468) + 1
+    while utils._elapsed_days(year + 1) <= jd:
+        year += 1
+    first_day = utils._elapsed_days(year)
+    while first_day > jd:
+        year -= 1
+        first_day = utils._elapsed_days(year)
+
+    days_remaining = jd - first_day
+    month_starts = utils._month_starts(year)
+    index = bisect_right(month_starts, days_remaining) - 1
+    month = utils._monthslist(year)[index]
+    day = days_remaining - month_starts[index] + 1
+    return year, month, day
+
+
+@lru_cache(maxsize=6)
+def _today(type_, pydate):
+    """Return `pydate` as a `type_` instance.
+
+    This is cached so that ``today()`` builds each date type only once
+    a day.
+    """
+    return type_.from_pydate(pydate)
+
+
 class Rounding(Enum):
     """Enumerator to provide options for rounding Hebrew dates.
 
@@ -69,18 +134,15 @@ class BaseDate(abc.ABC):
 
     Any subclass of ``BaseDate`` can be compared to and diffed with any other
     subclass date.
-    """
 
-    @property
-    @abc.abstractmethod
-    def jd(self):
-        """Return julian day number.
+    Subclasses must provide a ``jd`` attribute or property with the
+    Julian day number at midnight (as ``n.5``). They may also provide a
+    ``_jd_int`` attribute with the integer day number (``jd + .5``),
+    which is then used instead of ``jd`` for hashing, comparisons and
+    weekdays.
+    """
 
-        Returns
-        -------
-        float
-            The Julian day number at midnight (as ``n.5``).
-        """
+    __slots__ = ()
 
     @abc.abstractmethod
     def to_heb(self):
@@ -92,7 +154,27 @@ class BaseDate(abc.ABC):
         """
 
     def __hash__(self):
-        return hash(repr(self))
+        jd_int = getattr(self, '_jd_int', None)
+        if jd_int is None:
+            jd_int = floor(self.jd + .5)
+        return hash((type(self), jd_int))
+
+    def _jd_key(self, other):
+        """Return comparable day numbers for `self` and `other`.
+
+        The integer day numbers are used when both dates have them and
+        ``jd`` otherwise. Return ``NotImplemented`` if `other` is not a
+        date.
+        """
+        other_int = getattr(other, '_jd_int', None)
+        if other_int is not None:
+            self_int = getattr(self, '_jd_int', None)
+            if self_int is not None:
+                return self_int, other_int
+        other_jd = getattr(other, 'jd', None)
+        if other_jd is None:
+            return NotImplemented
+        return self.jd, other_jd
 
     def __add__(self, other):
         try:
@@ -101,48 +183,37 @@ class BaseDate(abc.ABC):
             return NotImplemented
 
     def __sub__(self, other):
+        key = self._jd_key(other)
+        if key is not NotImplemented:
+            return int(abs(key[0] - key[1]))
         try:
-            if isinstance(other, Number):
-                return JulianDay(self.jd - other)._to_x(self)
-            return int(abs(self.jd - other.jd))
-        except (AttributeError, TypeError):
+            return JulianDay(self.jd - other)._to_x(self)
+        except TypeError:
             return NotImplemented
 
     def __eq__(self, other):
-        try:
-            return self.jd == other.jd
-        except AttributeError:
-            return NotImplemented
+        key = self._jd_key(other)
+        return key if key is NotImplemented else key[0] == key[1]
 
     def __ne__(self, other):
-        try:
-            return self.jd != other.jd
-        except AttributeError:
-            return NotImplemented
+        key = self._jd_key(other)
+        return key if key is NotImplemented else key[0] != key[1]
 
     def __lt__(self, other):
-        try:
-            return self.jd < other.jd
-        except AttributeError:
-            return NotImplemented
+        key = self._jd_key(other)
+        return key if key is NotImplemented else key[0] < key[1]
 
     def __gt__(self, other):
-        try:
-            return self.jd > other.jd
-        except AttributeError:
-            return NotImplemented
+        key = self._jd_key(other)
+        return key if key is NotImplemented else key[0] > key[1]
 
     def __le__(self, other):
-        try:
-            return self.jd <= other.jd
-        except AttributeError:
-            return NotImplemented
+        key = self._jd_key(other)
+        return key if key is NotImplemented else key[0] <= key[1]
 
     def __ge__(self, other):
-        try:
-            return self.jd >= other.jd
-        except AttributeError:
-            return NotImplemented
+        key = self._jd_key(other)
+        return key if key is NotImplemented else key[0] >= key[1]
 
     def weekday(self):
         """Return day of week as an integer.
@@ -153,7 +224,10 @@ class BaseDate(abc.ABC):
             An integer representing the day of the week with Sunday as 1
             through Saturday as 7.
         """
-        return int(self.jd+.5+1) % 7 + 1
+        jd_int = getattr(self, '_jd_int', None)
+        if jd_int is None:
+            jd_int = floor(self.jd + .5)
+        return (jd_int + 1) % 7 + 1
 
     def isoweekday(self):
         """Return the day of the week corresponding to the iso standard.
@@ -345,16 +419,32 @@ class CalendarDateMixin:
         The equivalent Julian day at midnight.
     """
 
+    __slots__ = ('year', 'month', 'day', 'jd', '_jd_int')
+
     def __init__(self, year, month, day, jd=None):
         self.year = year
         self.month = month
         self.day = day
-        self._jd = jd
+        self.jd = jd
+        self._jd_int = int(jd + .5)
 
     def __repr__(self):
         class_name = self.__class__.__name__
         return f'{class_name}({self.year}, {self.month}, {self.day})'
 
+    def __getstate__(self):
+        return utils._getstate(self)
+
+    def __setstate__(self, state):
+        state = dict(state)
+        # Pickles from before __slots__ was added store ``_jd``, which
+        # may not have been calculated yet, instead of ``jd``.
+        state.pop('_jd', None)
+        utils._setstate(self, state)
+        if 'jd' not in state:
+            self.jd = self._calculate_jd(self.year, self.month, self.day)
+        self._jd_int = int(self.jd + .5)
+
     def __str__(self):
         return f'{self.year:04d}-{self.month:02d}-{self.day:02d}'
 
@@ -425,29 +515,30 @@ class JulianDay(BaseDate):
     ----------
     day : float
         The Julian Day Number at midnight (as *n*.5)
+    jd : float
+        The same value as `day`, provided for all date types.
     """
 
+    __slots__ = ('day', 'jd', '_jd_int')
+
     def __init__(self, day):
-        if day-int(day) < .5:
-            self.day = int(day) - .5
-        else:
-            self.day = int(day) + .5
+        self._jd_int = floor(day + .5)
+        self.day = self.jd = self._jd_int - .5
 
     def __repr__(self):
         return f'JulianDay({self.day})'
 
-    def __str__(self):
-        return str(self.day)
+    def __getstate__(self):
+        return utils._getstate(self)
 
-    @property
-    def jd(self):
-        """Return julian day.
+    def __setstate__(self, state):
+        # Pickles from before __slots__ was added only store ``day``.
+        utils._setstate(self, state)
+        self._jd_int = floor(self.day + .5)
+        self.day = self.jd = self._jd_int - .5
 
-        Returns
-        -------
-        float
-        """
-        return self.day
+    def __str__(self):
+        return str(self.day)
 
     @staticmethod
     def from_pydate(pydate):
@@ -483,7 +574,7 @@ class JulianDay(BaseDate):
         ``JulianDay(n.5)`` until the following midnight when it will
         return ``JulianDay(n.5 + 1)``.
         """
-        return GregorianDate.today().to_jd()
+        return _today(JulianDay, date.today())
 
     def to_greg(self):
         """Convert JulianDay to a Gregorian Date.
@@ -495,21 +586,10 @@ class JulianDay(BaseDate):
 
         Notes
         -----
-        This method uses the Fliegel-Van Flandern algorithm.
+        This method uses the Neri-Schneider algorithm with Euclidean
+        affine functions.
         """
-        jd = int(self.day + .5)
-        L = jd + 68569
-        n = 4*L // 146097
-        L = L - (146097*n + 3) // 4
-        i = (4000 * (L+1)) // 1461001
-        L = L - ((1461*i) // 4) + 31
-        j = (80*L) // 2447
-        day = L - 2447*j // 80
-        L = j // 11
-        month = j + 2 - 12*L
-        year = 100 * (n-49) + i + L
-        if year < 1:
-            year -= 1
+        year, month, day = _greg_from_jd(self._jd_int)
         return GregorianDate(year, month, day, self.day)
 
     def to_heb(self):
@@ -524,32 +604,20 @@ class JulianDay(BaseDate):
         if self.day <= 347997:
             raise ValueError('Date is before creation')
 
-        jd = int(self.day + .5)  # Try to account for half day
-        jd -= 347997
-        year = int(jd//365) + 2  # try that to debug early years
-        first_day = utils._elapsed_days(year)
-
-        while first_day > jd:
-            year -= 1
-            first_day = utils._elapsed_days(year)
-
-        months = utils._monthslist(year)
-        days_remaining = jd - first_day
-        for month in months:
-            if days_remaining >= utils._month_length(year, month):
-                days_remaining -= utils._month_length(year, month)
-            else:
-                return HebrewDate(year, month, days_remaining + 1, self.day)
+        year, month, day = _heb_from_jd(self._jd_int)
+        return HebrewDate(year, month, day, self.day)
 
     def _to_x(self, type_):
-        """Return a date object of the given type."""
-
-        if isinstance(type_, GregorianDate):
-            return self.to_greg()
-        if isinstance(type_, HebrewDate):
-            return self.to_heb()
-        if isinstance(type_, JulianDay):
-            return self
+        """Return a date object of the given type.
+
+        `type_` can be a date class or an instance of one.
+        """
+        if not isinstance(type_, type):
+            type_ = type(type_)
+        for cls in type_.__mro__:
+            converter = _CONVERTERS.get(cls)
+            if converter is not None:
+                return converter(self)
         raise TypeError(
             'This method has not been implemented with that type.'
         )
@@ -584,6 +652,8 @@ class GregorianDate(BaseDate, CalendarDateMixin):
     year : int
     month : int
     day : int
+    jd : float
+        The equivalent Julian day at midnight.
 
     Warnings
     --------
@@ -592,6 +662,8 @@ class GregorianDate(BaseDate, CalendarDateMixin):
     between date types and using arithmetic and comparison operators!
     """
 
+    __slots__ = ()
+
     def __init__(self, year, month, day, jd=None):
         """Initialize a GregorianDate.
 
@@ -600,9 +672,21 @@ class GregorianDate(BaseDate, CalendarDateMixin):
         """
         if month < 1 or month > 12:
             raise ValueError(f'{str(month)} is an invalid month.')
-        monthlength = self._monthlength(year, month)
+        try:
+            monthlength = _GREGORIAN_MONTH_LENGTHS[month]
+        except TypeError:
+            # Integral non-int months such as 2.0 are accepted.
+            if month % 1:
+                raise ValueError(
+                    f'{str(month)} is an invalid month.'
+                ) from None
+            monthlength = _GREGORIAN_MONTH_LENGTHS[int(month)]
+        if month == 2 and day > 28 and self._is_leap(year):
+            monthlength = 29
         if day < 1 or day > monthlength:
             raise ValueError(f'Given month has {monthlength} days.')
+        if jd is None:
+            jd = self._calculate_jd(year, month, day)
         super().__init__(year, month, day, jd)
 
     def __format__(self, fmt):
@@ -625,31 +709,18 @@ class GregorianDate(BaseDate, CalendarDateMixin):
         """
         return self.to_pydate().strftime(fmt)
 
-    @property
-    def jd(self):
-        """Return the corresponding Julian day number.
-
-        Returns
-        -------
-        float
-            The Julian day number at midnight.
-        """
-        if self._jd is None:
-            year = self.year
-            month = self.month
-            day = self.day
-            if year < 0:
-                year += 1
-            if month < 3:
-                year -= 1
-                month += 12
-            month += 1
-            a = year // 100
-            b = 2 - a + a//4
-            self._jd = (
-                int(365.25*year) + int(30.6001*month) + b + day + 1720994.5
-            )
-        return self._jd
+    @staticmethod
+    def _calculate_jd(year, month, day):
+        """Return the Julian day number at midnight of the given date."""
+        if year < 0:
+            year += 1
+        if month < 3:
+            year -= 1
+            month += 12
+        return (
+            365*year + year//4 - year//100 + year//400
+            + (153*month - 457)//5 + day + 1721118.5
+        )
 
     @classmethod
     def from_pydate(cls, pydate):
@@ -664,7 +735,10 @@ class GregorianDate(BaseDate, CalendarDateMixin):
         -------
         GregorianDate
         """
-        return cls(*pydate.timetuple()[:3])
+        return cls(
+            pydate.year, pydate.month, pydate.day,
+            pydate.toordinal() + 1721424.5
+        )
 
     @staticmethod
     def today():
@@ -678,16 +752,16 @@ class GregorianDate(BaseDate, CalendarDateMixin):
         GregorianDate
           The current Gregorian date from the computer's timestamp.
         """
-        return GregorianDate.from_pydate(date.today())
+        return _today(GregorianDate, date.today())
 
     @staticmethod
     def _is_leap(year):
         """Return True if year of date is a leap year, otherwise False."""
         if year < 0:
             year += 1
-        if (year % 4 == 0) and not (year % 100 == 0 and year % 400 != 0):
-            return True
-        return False
+        # Given year % 4 == 0, year % 100 == 0 iff year % 25 == 0 and
+        # year % 400 == 0 iff year % 16 == 0.
+        return not year & 3 and (year % 25 != 0 or not year & 15)
 
     def is_leap(self):
         """Return if the date is in a leap year
@@ -699,16 +773,6 @@ class GregorianDate(BaseDate, CalendarDateMixin):
         """
         return self._is_leap(self.year)
 
-    @classmethod
-    def _monthlength(cls, year, month):
-        if month in [1, 3, 5, 7, 8, 10, 12]:
-            return 31
-        if month == 2:
-            if cls._is_leap(year):
-                return 29
-            return 28
-        return 30
-
     def to_jd(self):
         """Convert to a Julian day.
 
@@ -727,7 +791,11 @@ class GregorianDate(BaseDate, CalendarDateMixin):
         HebrewDate
             The equivalent HebrewDate instance.
         """
-        return self.to_jd().to_heb()
+        if self.jd <= 347997:
+            raise ValueError('Date is before creation')
+
+        year, month, day = _heb_from_jd(self._jd_int)
+        return HebrewDate(year, month, day, self.jd)
 
     def to_pydate(self):
         """Convert to a standard library date.
@@ -797,6 +865,8 @@ class HebrewDate(BaseDate, CalendarDateMixin):
         If there is a second Adar it has a value of 13.
     day : int
         The day of the month.
+    jd : float
+        The equivalent Julian day at midnight.
 
     Raises
     ------
@@ -806,6 +876,8 @@ class HebrewDate(BaseDate, CalendarDateMixin):
         ``ValueError`` will be raised.
     """
 
+    __slots__ = ()
+
     def __init__(self, year, month, day, jd=None):
 
         """Initialize a HebrewDate instance.
@@ -822,6 +894,8 @@ class HebrewDate(BaseDate, CalendarDateMixin):
         monthlength = utils._month_length(year, month)
         if day < 1 or day > monthlength:
             raise ValueError(f'Given month has {monthlength} days.')
+        if jd is None:
+            jd = self._calculate_jd(year, month, day)
         super().__init__(year, month, day, jd)
 
     def __format__(self, fmt):
@@ -904,26 +978,13 @@ class HebrewDate(BaseDate, CalendarDateMixin):
             i += 1
         return ''.join(new)
 
-    @property
-    def jd(self):
-        """Return the corresponding Julian day number.
-
-        Returns
-        -------
-        float
-            The Julian day number at midnight.
-
-        """
-        if self._jd is None:
-            months = utils._monthslist(self.year)
-            jd = utils._elapsed_days(self.year)
-            for m in months:
-                if m != self.month:
-                    jd += utils._month_length(self.year, m)
-                else:
-                    self._jd = jd + (self.day-1) + 347996.5
-
-        return self._jd
+    @staticmethod
+    def _calculate_jd(year, month, day):
+        """Return the Julian day number at midnight of the given date."""
+        return (
+            utils._elapsed_days(year) + utils._month_offsets(year)[month]
+            + (day-1) + 347996.5
+        )
 
     @staticmethod
     def from_pydate(pydate):
@@ -958,7 +1019,7 @@ class HebrewDate(BaseDate, CalendarDateMixin):
         after nightfall but before midnight, to get the true Hebrew date do
         ``HebrewDate.today() + 1``.
         """
-        return GregorianDate.today().to_heb()
+        return _today(HebrewDate, date.today())
 
     def to_jd(self):
         """Convert to a Julian day.
@@ -978,7 +1039,8 @@ class HebrewDate(BaseDate, CalendarDateMixin):
         GregorianDate
             The equivalent GregorianDate instance.
         """
-        return self.to_jd().to_greg()
+        year, month, day = _greg_from_jd(self._jd_int)
+        return GregorianDate(year, month, day, self.jd)
 
     def to_pydate(self):
         """Convert to a standard library date.
@@ -1206,3 +1268,11 @@ class HebrewDate(BaseDate, CalendarDateMixin):
         the `days`.
         """
         return self.add(-years, -months, -days, adar1, rounding)
+
+
+# Used by JulianDay._to_x to convert to the type of another date.
+_CONVERTERS = {
+    JulianDay: lambda jd: jd,
+    GregorianDate: JulianDay.to_greg,
+    HebrewDate: JulianDay.to_heb,
+}
@@ -1,27 +1,11 @@
-_GEMATRIOS = {
-    1: 'א',
-    2: 'ב',
-    3: 'ג',
-    4: 'ד',
-    5: 'ה',
-    6: 'ו',
-    7: 'ז',
-    8: 'ח',
-    9: 'ט',
-    10: 'י',
-    20: 'כ',
-    30: 'ל',
-    40: 'מ',
-    50: 'נ',
-    60: 'ס',
-    70: 'ע',
-    80: 'פ',
-    90: 'צ',
-    100: 'ק',
-    200: 'ר',
-    300: 'ש',
-    400: 'ת'
-}
+from functools import lru_cache
+
+
+# Letters for each digit of the ones, tens and hundreds places. Each
+# full 400 of the hundreds place is written as a separate 'ת'.
+_ONES = ('', 'א', 'ב', 'ג', 'ד', 'ה', 'ו', 'ז', 'ח', 'ט')
+_TENS = ('', 'י', 'כ', 'ל', 'מ', 'נ', 'ס', 'ע', 'פ', 'צ')
+_HUNDREDS = ('', 'ק', 'ר', 'ש')
 
 
 def _stringify_gematria(letters):
@@ -37,16 +21,21 @@ def _stringify_gematria(letters):
 def _get_letters(num):
     """Convert numbers under 1,000 into raw letters."""
     ones = num % 10
-    tens = num % 100 - ones
-    hundreds = num % 1000 - tens - ones
-    four_hundreds = ''.join(['ת' for i in range(hundreds // 400)])
-    ones = _GEMATRIOS.get(ones, '')
-    tens = _GEMATRIOS.get(tens, '')
-    hundreds = _GEMATRIOS.get(hundreds % 400, '')
-    letters = f'{four_hundreds}{hundreds}{tens}{ones}'
-    return letters.replace('יה', 'טו').replace('יו', 'טז')
-
-
+    tens = num // 10 % 10
+    hundreds = num // 100 % 10
+    four_hundreds = 'ת' * (hundreds // 4)
+    hundreds = _HUNDREDS[hundreds % 4]
+    if tens == 1 and (ones == 5 or ones == 6):
+        # 15 and 16 are written as 9 + 6 and 9 + 7.
+        tens = 'ט'
+        ones = _ONES[ones + 1]
+    else:
+        tens = _TENS[tens]
+        ones = _ONES[ones]
+    return f'{four_hundreds}{hundreds}{tens}{ones}'
+
+
+@lru_cache(maxsize=1024)
 def _num_to_str(num, thousands=False, withgershayim=True):
     """Return gematria string for number.
 
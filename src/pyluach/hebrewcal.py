@@ -16,7 +16,6 @@ Contents
 * :func:`festival`
 * :func:`holiday`
 """
-from numbers import Number
 from itertools import repeat
 import calendar
 
@@ -98,17 +97,32 @@ class Year:
         True if the year is a leap year else false.
     """
 
+    __slots__ = ('year', 'leap', '_months', '_len')
+
     def __init__(self, year):
         if year < 1:
             raise ValueError(f'Year {year} is before creation.')
         self.year = year
         self.leap = utils._is_leap(year)
+        self._months = utils._monthslist(year)
+        self._len = utils._days_in_year(year)
 
     def __repr__(self):
         return f'Year({self.year})'
 
+    def __getstate__(self):
+        return utils._getstate(self)
+
+    def __setstate__(self, state):
+        # Pickles from before __slots__ was added only store ``year`` and
+        # ``leap``.
+        utils._setstate(self, state)
+        self.leap = utils._is_leap(self.year)
+        self._months = utils._monthslist(self.year)
+        self._len = utils._days_in_year(self.year)
+
     def __len__(self):
-        return utils._days_in_year(self.year)
+        return self._len
 
     def __eq__(self, other):
         if isinstance(other, Year):
@@ -157,7 +171,7 @@ class Year:
 
     def __iter__(self):
         """Yield integer for each month in year."""
-        yield from utils._monthslist(self.year)
+        return iter(self._months)
 
     def monthscount(self):
         """Return number of months in the year.
@@ -203,9 +217,11 @@ class Year:
             The next date of the Hebrew calendar year starting with
             the first of Tishrei.
         """
+        jd = HebrewDate(self.year, 7, 1).jd
         for month in self.itermonths():
             for day in month:
-                yield HebrewDate(self.year, month.month, day)
+                yield HebrewDate(self.year, month.month, day, jd)
+                jd += 1
 
     @classmethod
     def from_date(cls, date):
@@ -279,6 +295,8 @@ class Month:
         if necessary for Adar Sheni and then 1-6 for Nissan - Elul.
     """
 
+    __slots__ = ('year', 'month', '_len')
+
     def __init__(self, year, month):
         if year < 1:
             raise ValueError('Year must be >= 1.')
@@ -286,12 +304,22 @@ class Month:
         if month < 1 or month > 12 + utils._is_leap(self.year):
             raise IllegalMonthError(month)
         self.month = month
+        self._len = utils._month_length(year, month)
 
     def __repr__(self):
         return f'Month({self.year}, {self.month})'
 
+    def __getstate__(self):
+        return utils._getstate(self)
+
+    def __setstate__(self, state):
+        # Pickles from before __slots__ was added only store ``year`` and
+        # ``month``.
+        utils._setstate(self, state)
+        self._len = utils._month_length(self.year, self.month)
+
     def __len__(self):
-        return utils._month_length(self.year, self.month)
+        return self._len
 
     def __iter__(self):
         for day in range(1, len(self) + 1):
@@ -310,13 +338,12 @@ class Month:
             return NotImplemented
 
     def __sub__(self, other):
-        if isinstance(other, Number):
+        if isinstance(other, int):
             year, month = utils._subtract_months(self.year, self.month, other)
             return Month(year, month)
-        try:
+        if isinstance(other, Month):
             return abs(self._elapsed_months() - other._elapsed_months())
-        except AttributeError:
-            return NotImplemented
+        return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, Month):
@@ -384,7 +411,7 @@ class Month:
 
     def _month_number(self):
         """Return month number 1-12 or 13, Tishrei - Elul."""
-        return list(Year(self.year)).index(self.month) + 1
+        return utils._month_index(self.year, self.month) + 1
 
     def month_name(self, hebrew=False):
         """Return the name of the month.
@@ -429,14 +456,13 @@ class Month:
             The weekday of the first day of the month starting with Sunday as 1
             through Saturday as 7.
         """
-        return HebrewDate(self.year, self.month, 1).weekday()
+        return utils._weekday(self.year, self.month, 1)
 
     def _elapsed_months(self):
         """Return number of months elapsed from beginning of calendar"""
-        yearmonths = tuple(Year(self.year))
         months_elapsed = (
             utils._elapsed_months(self.year)
-            + yearmonths.index(self.month)
+            + utils._month_index(self.year, self.month)
         )
         return months_elapsed
 
@@ -448,8 +474,9 @@ class Month:
         :obj:`pyluach.dates.HebrewDate`
             The next Hebrew date of the month.
         """
+        jd = HebrewDate(self.year, self.month, 1).jd
         for day in self:
-            yield HebrewDate(self.year, self.month, day)
+            yield HebrewDate(self.year, self.month, day, jd + day - 1)
 
     def molad(self):
         """Return the month's molad.
@@ -654,8 +681,20 @@ class HebrewCalendar(calendar.Calendar):
             with the last date of the week that the last day of the month
             falls in.
         """
+        date = None
         for y, m, d in self.itermonthdays3(year, month):
-            yield HebrewDate(y, m, d)
+            # Only reuse the previous jd for the following day.
+            # ``itermonthdays3`` repeats the first month in place of the
+            # month before the earliest supported month.
+            if (
+                date is not None
+                and (date.year, date.month, date.day + 1) == (y, m, d)
+            ):
+                jd = date.jd + 1
+            else:
+                jd = None
+            date = HebrewDate(y, m, d, jd)
+            yield date
 
     def itermonthdays(self, year, month):
         """Like ``itermonthdates()`` but will yield day numbers.
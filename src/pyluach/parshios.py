@@ -31,8 +31,8 @@ PARSHIOS_HEBREW : list of str
 from collections import deque, OrderedDict
 from functools import lru_cache
 
-from pyluach.dates import HebrewDate
-from pyluach.utils import _is_leap
+from pyluach.dates import HebrewDate, JulianDay
+from pyluach.utils import _days_in_year, _is_leap, _weekday
 
 
 PARSHIOS = [
@@ -59,14 +59,21 @@ PARSHIOS_HEBREW = [
 ]
 
 
+# Parsha numbers in the order they are read from Rosh Hashana. Nitzavim
+# and Vayeilech come first in case they fall after Rosh Hashana.
+_PARSHA_ORDER = (51, 52) + tuple(range(52))
+
+
 def _parshaless(date, israel=False):
-    if israel and date.tuple()[1:] in [(7, 23), (1, 22), (3, 7)]:
+    month = date.month
+    day = date.day
+    if israel and (month, day) in ((7, 23), (1, 22), (3, 7)):
         return False
-    if date.month == 7 and date.day in ([1, 2, 10] + list(range(15, 24))):
+    if month == 7 and (day in (1, 2, 10) or 15 <= day <= 23):
         return True
-    if date.month == 1 and date.day in range(15, 23):
+    if month == 1 and 15 <= day <= 22:
         return True
-    if date.month == 3 and date.day in [6, 7]:
+    if month == 3 and day in (6, 7):
         return True
     return False
 
@@ -78,35 +85,41 @@ def _gentable(year, israel=False):
     The numbers start with Beraishis as 0. Double parshios are represented
     as a list of the two numbers. If there is no Parsha the value is None.
     """
-    parshalist = deque([51, 52] + list(range(52)))
+    parshalist = deque(_PARSHA_ORDER)
     table = OrderedDict()
     leap = _is_leap(year)
-    pesachday = HebrewDate(year, 1, 15).weekday()
+    pesachday = _weekday(year, 1, 15)
     rosh_hashana = HebrewDate(year, 7, 1)
-    shabbos = rosh_hashana.shabbos()
-    if rosh_hashana.weekday() > 4:
+    if _weekday(year, 7, 1) > 4:
         parshalist.popleft()
-
-    while shabbos.year == year:
+    pesach_eve = HebrewDate(year, 1, 14)
+    tisha_bav = HebrewDate(year, 5, 9)
+    long_next_year = _weekday(year + 1, 7, 1) > 4
+    end = rosh_hashana.jd + _days_in_year(year)
+
+    # Step through the Shabbosos by Julian day and convert each once.
+    jd = rosh_hashana.shabbos().jd
+    while jd < end:
+        shabbos = JulianDay(jd).to_heb()
         if _parshaless(shabbos, israel):
             table[shabbos] = None
         else:
             parsha = parshalist.popleft()
             table[shabbos] = [parsha]
             if (
-                (parsha == 21 and (HebrewDate(year, 1, 14) - shabbos) // 7 < 3)
+                (parsha == 21 and (pesach_eve - shabbos) // 7 < 3)
                 or (parsha in [26, 28] and not leap)
                 or (
                     parsha == 31 and not leap
                     and (not israel or pesachday != 7)
                 )
                 or (parsha == 38 and not israel and pesachday == 5)
-                or (parsha == 41 and (HebrewDate(year, 5, 9)-shabbos) // 7 < 2)
-                or (parsha == 50 and HebrewDate(year+1, 7, 1).weekday() > 4)
+                or (parsha == 41 and (tisha_bav - shabbos) // 7 < 2)
+                or (parsha == 50 and long_next_year)
             ):
                 #  If any of that then it's a double parsha.
                 table[shabbos].append(parshalist.popleft())
-        shabbos += 7
+        jd += 7
     return table
 
 
@@ -191,9 +204,7 @@ def iterparshios(year, israel=False):
       given year. Yields ``None`` for a Shabbos that doesn't have its
       own parsha (i.e. it occurs on a yom tov).
     """
-    table = _gentable(year, israel)
-    for shabbos in table.values():
-        yield shabbos
+    yield from _gentable(year, israel).values()
 
 
 def parshatable(year, israel=False):
@@ -80,6 +80,16 @@ FESTIVALS_HEBREW = [
 ]
 
 
+_MONTHS_COMMON = (7, 8, 9, 10, 11, 12, 1, 2, 3, 4, 5, 6)
+
+_MONTHS_LEAP = (7, 8, 9, 10, 11, 12, 13, 1, 2, 3, 4, 5, 6)
+
+# Position of each month in the year starting with Tishrei as 0.
+_MONTH_INDEX_COMMON = {month: i for i, month in enumerate(_MONTHS_COMMON)}
+
+_MONTH_INDEX_LEAP = {month: i for i, month in enumerate(_MONTHS_LEAP)}
+
+
 WEEKDAYS = {
     1: 'ראשון',
     2: 'שני',
@@ -91,46 +101,59 @@ WEEKDAYS = {
 }
 
 
+# Leap years repeat every 19 years (the Metonic cycle).
+_LEAP_YEARS = tuple(((7*year) + 1) % 19 < 7 for year in range(19))
+
+
 def _is_leap(year):
-    if (((7*year) + 1) % 19) < 7:
-        return True
-    return False
+    return _LEAP_YEARS[year % 19]
 
 
 def _elapsed_months(year):
     return (235 * year - 234) // 19
 
 
-@lru_cache(maxsize=10)
+@lru_cache(maxsize=None)
 def _elapsed_days(year):
-    months_elapsed = _elapsed_months(year)
-    parts_elapsed = 204 + 793*(months_elapsed%1080)
-    hours_elapsed = (
-        5 + 12*months_elapsed + 793*(months_elapsed//1080)
-        + parts_elapsed//1080)
-    conjunction_day = 1 + 29*months_elapsed + hours_elapsed//24
-    conjunction_parts = 1080 * (hours_elapsed%24) + parts_elapsed%1080
+    # The molad is counted in parts (1080 to the hour, 25920 to the
+    # day). The first molad is day 1, 5 hours and 204 parts (31524
+    # parts) and each month adds 29 days, 12 hours and 793 parts (765433
+    # parts).
+    conjunction_day, conjunction_parts = divmod(
+        31524 + 765433*_elapsed_months(year), 25920)
+    conjunction_weekday = conjunction_day % 7
 
     if (
         (conjunction_parts >= 19440)
         or (
-            (conjunction_day % 7 == 2) and (conjunction_parts >= 9924)
-            and not _is_leap(year)
+            (conjunction_weekday == 2) and (conjunction_parts >= 9924)
+            and not _LEAP_YEARS[year % 19]
         )
         or (
-            (conjunction_day % 7 == 1) and conjunction_parts >= 16789
-            and _is_leap(year - 1)
+            (conjunction_weekday == 1) and conjunction_parts >= 16789
+            and _LEAP_YEARS[(year-1) % 19]
         )
     ):
         alt_day = conjunction_day + 1
     else:
         alt_day = conjunction_day
-    if alt_day % 7 in [0, 3, 5]:
+    if alt_day % 7 in {0, 3, 5}:
         alt_day += 1
 
     return alt_day
 
 
+def _precompute_elapsed_days(years):
+    """Fill the ``_elapsed_days`` cache for the given years."""
+    for year in years:
+        _elapsed_days(year)
+
+
+# Warm the cache for about 1840 - 2340 C.E.
+_precompute_elapsed_days(range(5600, 6101))
+
+
+@lru_cache(maxsize=None)
 def _days_in_year(year):
     return _elapsed_days(year + 1) - _elapsed_days(year)
 
@@ -145,25 +168,38 @@ def _short_kislev(year):
     return _days_in_year(year) % 10 == 3
 
 
+# The month tables only depend on the length of the year, which is
+# always one of 353, 354, 355, 383, 384 or 385 days, so at most six of
+# each are ever built and every year of the same length shares them.
+@lru_cache(maxsize=None)
+def _month_lengths_for(days_in_year):
+    cheshvan = 30 if days_in_year % 10 == 5 else 29
+    kislev = 29 if days_in_year % 10 == 3 else 30
+    adar = 30 if days_in_year > 380 else 29
+    return (0, 30, 29, 30, 29, 30, 29, 30, cheshvan, kislev, 29, 30, adar, 29)
+
+
+@lru_cache(maxsize=None)
+def _month_lengths(year):
+    """Return the month lengths of the year indexed by month number.
+
+    Index 0 is a placeholder so that ``_month_lengths(year)[month]`` is
+    the length of `month`.
+    """
+    return _month_lengths_for(_days_in_year(year))
+
+
 def _month_length(year, month):
     """Months start with Nissan (Nissan is 1 and Tishrei is 7)"""
-    if month in [1, 3, 5, 7, 11]:
-        return 30
-    if month in [2, 4, 6, 10, 13]:
-        return 29
-    if month == 12:
-        if _is_leap(year):
-            return 30
-        return 29
-    if month == 8:   # if long Cheshvan return 30, else return 29
-        if _long_cheshvan(year):
-            return 30
-        return 29
-    if month == 9:   # if short Kislev return 29, else return 30
-        if _short_kislev(year):
-            return 29
-        return 30
-    raise ValueError('Invalid month')
+    if not 1 <= month <= 13:
+        raise ValueError('Invalid month')
+    try:
+        return _month_lengths(year)[month]
+    except TypeError:
+        # Integral non-int months such as 7.0 are accepted.
+        if month % 1:
+            raise ValueError('Invalid month') from None
+        return _month_lengths(year)[int(month)]
 
 
 def _month_name(year, month, hebrew):
@@ -176,27 +212,92 @@ def _month_name(year, month, hebrew):
 
 
 def _monthslist(year):
-    months = [7, 8, 9, 10, 11, 12, 13, 1, 2, 3, 4, 5, 6]
-    if not _is_leap(year):
-        months.remove(13)
-    return months
+    if _LEAP_YEARS[year % 19]:
+        return _MONTHS_LEAP
+    return _MONTHS_COMMON
+
+
+def _month_index(year, month):
+    """Return the position of `month` in ``_monthslist(year)``."""
+    if _LEAP_YEARS[year % 19]:
+        return _MONTH_INDEX_LEAP[month]
+    return _MONTH_INDEX_COMMON[month]
+
+
+@lru_cache(maxsize=None)
+def _month_starts_for(days_in_year):
+    lengths = _month_lengths_for(days_in_year)
+    if days_in_year > 380:
+        months = _MONTHS_LEAP
+    else:
+        months = _MONTHS_COMMON
+    starts = []
+    days = 0
+    for month in months:
+        starts.append(days)
+        days += lengths[month]
+    return tuple(starts)
+
+
+@lru_cache(maxsize=None)
+def _month_offsets_for(days_in_year):
+    if days_in_year > 380:
+        months = _MONTHS_LEAP
+    else:
+        months = _MONTHS_COMMON
+    return dict(zip(months, _month_starts_for(days_in_year)))
+
+
+@lru_cache(maxsize=None)
+def _month_starts(year):
+    """Return the number of days in the year before each month.
+
+    The offsets are in the order of ``_monthslist(year)`` starting with
+    Tishrei.
+    """
+    return _month_starts_for(_days_in_year(year))
+
+
+@lru_cache(maxsize=None)
+def _month_offsets(year):
+    """Return a dict of month number to days in the year before it."""
+    return _month_offsets_for(_days_in_year(year))
+
+
+def _weekday(year, month, day):
+    """Return the weekday of a Hebrew date with Sunday as 1."""
+    return (
+        _elapsed_days(year) + _month_offsets(year)[month] + day + 347997
+    ) % 7 + 1
 
 
 def _add_months(year, month, num):
-    monthslist = _monthslist(year)
-    index = monthslist.index(month)
-    months_remaining = len(monthslist[index+1:])
-    if num <= months_remaining:
-        return (year, monthslist[index + num])
-    return _add_months(year + 1, 7, num - months_remaining - 1)
+    months = _elapsed_months(year) + _month_index(year, month) + num
+    # Inverse of _elapsed_months.
+    year = (19*months + 252) // 235
+    return (year, _monthslist(year)[months - _elapsed_months(year)])
 
 
 def _subtract_months(year, month, num):
-    monthslist = _monthslist(year)
-    index = monthslist.index(month)
-    if num <= index:
-        return (year, monthslist[index - num])
-    return _subtract_months(year - 1, 6, num - (index+1))
+    return _add_months(year, month, -num)
+
+
+# The only days that can be a fast day or a festival. The rules in
+# ``_fast_day_of`` and ``_festival_of`` are only tested on these.
+_FAST_DAY_CANDIDATES = (
+    (7, 3), (7, 4), (10, 10), (12, 11), (12, 13), (13, 11), (13, 13),
+    (4, 17), (4, 18), (5, 9), (5, 10),
+)
+
+_FESTIVAL_CANDIDATES = (
+    ((7, 1), (7, 2), (7, 10))
+    + tuple((7, day) for day in range(15, 24))
+    + tuple((9, day) for day in range(25, 31))
+    + ((10, 1), (10, 2), (10, 3), (11, 15))
+    + ((12, 14), (12, 15), (13, 14), (13, 15))
+    + tuple((1, day) for day in range(15, 23))
+    + ((2, 14), (2, 18), (3, 6), (3, 7), (5, 15))
+)
 
 
 def _fast_day(date):
@@ -215,10 +316,24 @@ def _fast_day(date):
       a fast day.
     """
     date = date.to_heb()
-    year = date.year
-    month = date.month
-    day = date.day
-    weekday = date.weekday()
+    return _fast_day_table(date.year).get((date.month, date.day))
+
+
+@lru_cache(maxsize=128)
+def _fast_day_table(year):
+    """Return a dict of ``(month, day)`` to fast day for the year."""
+    table = {}
+    leap = _is_leap(year)
+    for month, day in _FAST_DAY_CANDIDATES:
+        if month == 13 and not leap:
+            continue
+        fast = _fast_day_of(year, month, day, _weekday(year, month, day))
+        if fast is not None:
+            table[(month, day)] = fast
+    return table
+
+
+def _fast_day_of(year, month, day, weekday):
     adar = 13 if _is_leap(year) else 12
 
     if month == 7:
@@ -289,9 +404,23 @@ def _festival(date, israel=False, include_working_days=True):
       festival.
     """
     date = date.to_heb()
-    year = date.year
-    month = date.month
-    day = date.day
+    return _festival_table(date.year, israel, include_working_days).get(
+        (date.month, date.day)
+    )
+
+
+@lru_cache(maxsize=128)
+def _festival_table(year, israel, include_working_days):
+    """Return a dict of ``(month, day)`` to festival for the year."""
+    table = {}
+    for month, day in _FESTIVAL_CANDIDATES:
+        festival = _festival_of(year, month, day, israel, include_working_days)
+        if festival is not None:
+            table[(month, day)] = festival
+    return table
+
+
+def _festival_of(year, month, day, israel, include_working_days):
     if month == 7:
         if day in [1, 2]:
             return _Days.ROSH_HASHANA
@@ -359,3 +488,41 @@ def _festival_string(
     if hebrew:
         return _days_hebrew[festival]
     return festival.value
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls):
+    """Return the names of all the slots of `cls` and its bases."""
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = f'_{klass.__name__.lstrip("_")}{name}'
+            names.append(name)
+    return tuple(names)
+
+
+def _getstate(obj):
+    """Return the pickle state of a slotted object as a dict.
+
+    Attributes in an instance ``__dict__`` (if a subclass adds one) are
+    included along with the slots.
+    """
+    state = dict(getattr(obj, '__dict__', ()))
+    for name in _slot_names(type(obj)):
+        try:
+            state[name] = getattr(obj, name)
+        except AttributeError:
+            pass
+    return state
+
+
+def _setstate(obj, state):
+    """Restore attributes from a dict returned by ``_getstate``."""
+    for name, value in state.items():
+        setattr(obj, name, value)
@@ -1,4 +1,6 @@
 import datetime
+import pickle
+from copy import copy
 from operator import gt, lt, eq, ne, ge, le, add, sub
 
 import pytest
@@ -25,39 +27,68 @@ def datetypeslist():
     return datetypes
 
 
+@pytest.fixture(scope='module')
+def sample_jds():
+    return [dates.JulianDay(i) for i in range(347998, 2460000, 117)]
+
+
 class TestClassesSanity:
-    def test_greg_sanity(self):
-        for i in range(347998, 2460000, 117):
-            jd = dates.JulianDay(i)
+    def test_greg_sanity(self, sample_jds):
+        for jd in sample_jds:
             conf = jd.to_greg().to_jd()
-            if jd >= dates.GregorianDate(1, 1, 1):
-                assert jd.day == conf.day
-            else:
-                assert abs(jd.day - conf.day) <= 1
+            assert jd.day == conf.day
         bce = GregorianDate(-100, 1, 1)
-        assert abs(bce.to_heb().to_greg() - bce) <= 1
+        assert bce.to_heb().to_greg() == bce
 
-    def test_heb_sanity(self):
-        for i in range(347998, 2460000, 117):
-            jd = dates.JulianDay(i)
+    def test_heb_sanity(self, sample_jds):
+        for jd in sample_jds:
             conf = jd.to_heb().to_jd()
             assert jd.day == conf.day
 
 
+def test_jd_to_greg():
+    assert JulianDay(2451544.5).to_greg() == GregorianDate(2000, 1, 1)
+    assert JulianDay(2451603.5).to_greg().tuple() == (2000, 2, 29)
+    assert JulianDay(2415079.5).to_greg().tuple() == (1900, 3, 1)
+    assert JulianDay(1721425.5).to_greg().tuple() == (1, 1, 1)
+    assert JulianDay(1721424.5).to_greg().tuple() == (-1, 12, 31)
+    first = datetime.date.min.toordinal()
+    last = datetime.date.max.toordinal()
+    for ordinal in range(first, last + 1, 367):
+        pydate = datetime.date.fromordinal(ordinal)
+        greg = JulianDay(ordinal + 1721424.5).to_greg()
+        assert greg.tuple() == (pydate.year, pydate.month, pydate.day)
+
+
+def test_to_x():
+    jd = JulianDay(2460000.5)
+    heb = jd.to_heb()
+    for target in [heb, HebrewDate]:
+        assert jd._to_x(target).tuple() == heb.tuple()
+    assert jd._to_x(GregorianDate) == jd.to_greg()
+    assert jd._to_x(JulianDay) is jd
+
+
+def test_jd_rounding():
+    assert JulianDay(550.2).day == 549.5
+    assert JulianDay(550.7).day == 550.5
+    assert JulianDay(-3.2).day == -3.5
+    assert JulianDay(-3.7).day == -4.5
+    assert JulianDay(-4).day == -4.5
+    assert isinstance(JulianDay(10).day, float)
+
+
+@pytest.mark.parametrize('greg, heb', KNOWN_VALUES.items())
 class TestClassesConversion:
-    def test_from_greg(self):
-        for date in KNOWN_VALUES:
-            heb = dates.GregorianDate(*date).to_heb().tuple()
-            assert KNOWN_VALUES[date] == heb
+    def test_from_greg(self, greg, heb):
+        assert dates.GregorianDate(*greg).to_heb().tuple() == heb
 
-    def test_from_heb(self):
-        for date in KNOWN_VALUES:
-            greg = dates.HebrewDate(*KNOWN_VALUES[date]).to_greg().tuple()
-            assert date == greg
+    def test_from_heb(self, greg, heb):
+        assert dates.HebrewDate(*heb).to_greg().tuple() == greg
 
 
-@pytest.fixture
-def setup(scope='module'):
+@pytest.fixture(scope='module')
+def setup():
     caltypes = [GregorianDate, HebrewDate, JulianDay]
     deltas = [0, 1, 29, 73, 1004]
     return {'caltypes': caltypes, 'deltas': deltas}
@@ -67,16 +98,16 @@ class TestOperators:
 
     def test_add(self, setup):
         for cal in setup['caltypes']:
+            date = cal.today()
             for delta in setup['deltas']:
-                date = cal.today()
                 date2 = date + delta
                 assert date.jd + delta == date2.jd
 
     def test_min_int(self, setup):
         """Test subtracting a number from a date"""
         for cal in setup['caltypes']:
+            date = cal.today()
             for delta in setup['deltas']:
-                date = cal.today()
                 date2 = date - delta
                 assert date.jd - delta == date2.jd
 
@@ -88,10 +119,11 @@ class TestOperators:
         current date.
         """
         for cal in setup['caltypes']:
+            today = cal.today()
             for cal2 in setup['caltypes']:
+                today2 = cal2.today()
                 for delta in setup['deltas']:
-                    today = cal.today()
-                    difference = (cal2.today() - delta) - today
+                    difference = (today2 - delta) - today
                     assert delta == difference
                     assert isinstance(difference, int)
 
@@ -177,14 +209,18 @@ class TestErrors:
         for datetuple in [(5778, 6, 0), (5779, 8, 31), (5779, 10, 30)]:
             with pytest.raises(ValueError):
                 HebrewDate(*datetuple)
+        with pytest.raises(ValueError):
+            HebrewDate(5784, 7.5, 1)
+        assert HebrewDate(5784, 7.0, 1) == HebrewDate(5784, 7, 1)
 
     def test_GregorianDate_errors(self):
         for datetuple in [
             (2018, 0, 3), (2018, -2, 8), (2018, 13, 9),
-            (2018, 2, 0), (2018, 2, 29), (2012, 2, 30)
+            (2018, 2, 0), (2018, 2, 29), (2012, 2, 30), (2018, 2.5, 1)
         ]:
             with pytest.raises(ValueError):
                 GregorianDate(*datetuple)
+        assert GregorianDate(2020, 2.0, 29) == GregorianDate(2020, 2, 29)
 
     def test_JD_errors(self):
         with pytest.raises(ValueError):
@@ -212,6 +248,114 @@ class TestReprandStr:
         assert str(GregorianDate(1, 1, 1)) == '0001-01-01'
 
 
+def test_copy_and_pickle():
+    heb = HebrewDate(5784, 13, 29)
+    for date in [heb, heb.to_greg(), heb.to_jd()]:
+        assert not hasattr(date, '__dict__')
+        assert copy(date) == date
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(date, protocol))
+            assert unpickled == date
+            assert type(unpickled) is type(date)
+
+
+# Pickles written by pyluach 2.2.0, before the date classes had slots.
+LEGACY_PICKLES = [
+    (
+        b'\x80\x02cpyluach.dates\nHebrewDate\nq\x00)\x81q\x01}q\x02(X'
+        b'\x04\x00\x00\x00yearq\x03M\x98\x16X\x05\x00\x00\x00monthq'
+        b'\x04K\rX\x03\x00\x00\x00dayq\x05K\x1dX\x03\x00\x00\x00_jd'
+        b'q\x06Nub.',
+        HebrewDate(5784, 13, 29)
+    ),
+    (
+        b'ccopy_reg\n_reconstructor\np0\n(cpyluach.dates\nHebrewDate\np1'
+        b'\nc__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nVyear\np6\nI5784'
+        b'\nsVmonth\np7\nI13\nsVday\np8\nI29\nsV_jd\np9\nNsb.',
+        HebrewDate(5784, 13, 29)
+    ),
+    (
+        b'\x80\x02cpyluach.dates\nGregorianDate\nq\x00)\x81q\x01}q\x02('
+        b'X\x04\x00\x00\x00yearq\x03M\xe8\x07X\x05\x00\x00\x00monthq'
+        b'\x04K\x02X\x03\x00\x00\x00dayq\x05K\x1dX\x03\x00\x00\x00_jd'
+        b'q\x06GAB\xc5h\xc0\x00\x00\x00ub.',
+        GregorianDate(2024, 2, 29)
+    ),
+    (
+        b'\x80\x02cpyluach.dates\nGregorianDate\nq\x00)\x81q\x01}q\x02('
+        b'X\x04\x00\x00\x00yearq\x03J\x9c\xff\xff\xffX\x05\x00\x00\x00'
+        b'monthq\x04K\x03X\x03\x00\x00\x00dayq\x05K\x01X\x03\x00\x00'
+        b'\x00_jdq\x06GA9\xb5\xe0\x80\x00\x00\x00ub.',
+        GregorianDate(-100, 3, 1)
+    ),
+    (
+        b'\x80\x02cpyluach.dates\nJulianDay\nq\x00)\x81q\x01}q\x02X\x03'
+        b'\x00\x00\x00dayq\x03GAB\xc4\xb0@\x00\x00\x00sb.',
+        JulianDay(2460000.5)
+    ),
+]
+
+
+@pytest.mark.parametrize('data, expected', LEGACY_PICKLES)
+def test_legacy_pickle(data, expected):
+    date = pickle.loads(data)
+    assert type(date) is type(expected)
+    assert date == expected
+    assert date.jd == expected.jd
+    assert date.weekday() == expected.weekday()
+    assert hash(date) == hash(expected)
+
+
+class LabelledDate(HebrewDate):
+    __slots__ = ('label',)
+
+    def __init__(self, label, year, month, day):
+        super().__init__(year, month, day)
+        self.label = label
+
+
+def test_pickle_subclass():
+    date = LabelledDate('Purim', 5784, 13, 14)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        unpickled = pickle.loads(pickle.dumps(date, protocol))
+        assert unpickled == date
+        assert unpickled.label == 'Purim'
+    assert copy(date).label == 'Purim'
+
+
+def test_hash():
+    heb = HebrewDate(5784, 13, 29)
+    assert hash(heb) == hash(HebrewDate(5784, 13, 29))
+    assert len({heb, heb.to_greg(), heb.to_jd()}) == 3
+
+
+class JDOnlyDate(dates.BaseDate):
+    """A date type that only provides ``jd``."""
+
+    def __init__(self, jd):
+        self.jd = jd
+
+    def to_heb(self):
+        return JulianDay(self.jd).to_heb()
+
+
+def test_jd_only_subclass():
+    jd = JulianDay(2460000.5)
+    date = JDOnlyDate(2460000.5)
+    assert date == jd
+    assert jd == date
+    assert not date != jd
+    assert date < jd + 1
+    assert jd + 1 > date
+    assert date <= jd <= date
+    assert date >= jd >= date
+    assert date - (jd + 3) == 3
+    assert (jd + 3) - date == 3
+    assert date.weekday() == jd.weekday()
+    assert hash(date) == hash(JDOnlyDate(2460000.5))
+    assert date.to_heb() == jd.to_heb()
+
+
 def test_weekday():
     assert GregorianDate(2017, 8, 7).weekday() == 2
     assert HebrewDate(5777, 6, 1).weekday() == 4
@@ -279,6 +423,7 @@ def test_from_pydate():
     assert date == GregorianDate.from_pydate(date).to_jd().to_pydate()
     assert date == HebrewDate.from_pydate(date).to_pydate()
     assert date == JulianDay.from_pydate(date).to_pydate()
+    assert GregorianDate.from_pydate(date).jd == GregorianDate(2018, 8, 27).jd
 
 
 def test_is_leap():
@@ -1,11 +1,12 @@
 import datetime
 from copy import copy
 import calendar
+import pickle
 
 from pytest import fixture, raises
 from bs4 import BeautifulSoup
 
-from pyluach import dates, hebrewcal
+from pyluach import dates, hebrewcal, utils
 from pyluach.hebrewcal import Year, Month, holiday, festival, fast_day
 from pyluach.hebrewcal import HebrewTextCalendar, HebrewHTMLCalendar
 
@@ -155,6 +156,9 @@ class TestMonth:
             month + month
         with raises(TypeError):
             month + 'str'
+        assert hebrewcal.Month(5784, 7) + -1 == hebrewcal.Month(5783, 6)
+        far = hebrewcal.Month(1, 7) + 100000
+        assert far - 100000 == hebrewcal.Month(1, 7)
 
     def test_subtract_month(self):
         month1 = hebrewcal.Month(5775, 10)
@@ -490,6 +494,68 @@ class TestFasts:
         assert holiday(dates.HebrewDate(5778, 5, 9)) is None
 
 
+def test_holiday_tables():
+    """Check that the tables miss no day the rules would match."""
+    for year in range(5770, 5800):
+        date = dates.HebrewDate(year, 7, 1)
+        while date.year == year:
+            key = (date.month, date.day)
+            assert utils._fast_day_table(year).get(key) == (
+                utils._fast_day_of(year, *key, date.weekday())
+            )
+            for israel in [False, True]:
+                for working in [False, True]:
+                    table = utils._festival_table(year, israel, working)
+                    assert table.get(key) == (
+                        utils._festival_of(year, *key, israel, working)
+                    )
+            date += 1
+
+
+def test_pickle():
+    for obj in [Year(5784), Month(5784, 13)]:
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(obj, protocol)) == obj
+
+
+# Pickles written by pyluach 2.2.0, before Year and Month had slots.
+LEGACY_PICKLES = [
+    (
+        b'\x80\x02cpyluach.hebrewcal\nYear\nq\x00)\x81q\x01}q\x02(X\x04'
+        b'\x00\x00\x00yearq\x03M\x98\x16X\x04\x00\x00\x00leapq\x04\x88'
+        b'ub.',
+        Year(5784)
+    ),
+    (
+        b'ccopy_reg\n_reconstructor\np0\n(cpyluach.hebrewcal\nYear\np1\n'
+        b'c__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nVyear\np6\nI5784\n'
+        b'sVleap\np7\nI01\nsb.',
+        Year(5784)
+    ),
+    (
+        b'\x80\x02cpyluach.hebrewcal\nMonth\nq\x00)\x81q\x01}q\x02(X\x04'
+        b'\x00\x00\x00yearq\x03M\x98\x16X\x05\x00\x00\x00monthq\x04K\r'
+        b'ub.',
+        Month(5784, 13)
+    ),
+    (
+        b'\x80\x02cpyluach.hebrewcal\nMonth\nq\x00)\x81q\x01}q\x02(X\x04'
+        b'\x00\x00\x00yearq\x03M\x97\x16X\x05\x00\x00\x00monthq\x04K'
+        b'\x08ub.',
+        Month(5783, 8)
+    ),
+]
+
+
+def test_legacy_pickle():
+    for data, expected in LEGACY_PICKLES:
+        obj = pickle.loads(data)
+        assert type(obj) is type(expected)
+        assert obj == expected
+        assert len(obj) == len(expected)
+        assert list(obj) == list(expected)
+
+
 def test_to_hebrew_numeral():
     assert hebrewcal.to_hebrew_numeral(5782) == 'תשפ״ב'
 
@@ -517,7 +583,11 @@ class TestCalendar:
             assert weekdays[-1] == last
 
     def test_first_month(self, cal):
-        list(cal.itermonthdates(1, 7))
+        for date in cal.itermonthdates(1, 7):
+            fresh = dates.HebrewDate(*date.tuple())
+            assert date.jd == fresh.jd
+            assert date == fresh
+        assert dates.HebrewDate(1, 7, 1) in cal.itermonthdates(1, 7)
 
     def test_itermonthdates(self, cal):
         adar2 = list(cal.itermonthdates(5782, 13))